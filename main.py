@@ -4,11 +4,12 @@ import logging
 import signal
 import sys
 import time
-from datetime import datetime
+from typing import Optional
+from logging.handlers import RotatingFileHandler
 
-from src.config import config
-from src.scraper import Scraper
-from src.storage import Storage
+from src.config import get_config
+from src.scraper import Scraper, get_browser_pool, validate_site_config
+from src.storage import Storage, get_storage
 from src.differ import Differ
 from src.notifier import TelegramNotifier
 
@@ -18,59 +19,73 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('scraper.log')
+        RotatingFileHandler('scraper.log', maxBytes=5_000_000, backupCount=3, encoding='utf-8')
     ]
 )
 
 logger = logging.getLogger(__name__)
 
-# Global flag for graceful shutdown
-running = True
+# Scrape cycle currently running, cancelled on shutdown
+active_cycle: Optional[asyncio.Task] = None
 
 
-def signal_handler(sig, frame):
-    """Handle interrupt signal for graceful shutdown."""
-    global running
-    logger.info("Interrupt received, shutting down gracefully...")
-    running = False
+def install_signal_handlers(stop_event: asyncio.Event):
+    """Set stop_event and cancel the running cycle on SIGINT/SIGTERM."""
+    loop = asyncio.get_running_loop()
 
+    def request_shutdown():
+        if not stop_event.is_set():
+            logger.info("Interrupt received, shutting down gracefully...")
+        stop_event.set()
+        # Don't wait for a slow or hung scrape to notice the flag
+        if active_cycle is not None:
+            active_cycle.cancel()
 
-def run_scrape_cycle_sync():
-    """Run a single scrape cycle synchronously."""
-    logger.info("=" * 50)
-    logger.info(f"Starting scrape cycle at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info("=" * 50)
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_shutdown)
+        except NotImplementedError:
+            # add_signal_handler is unsupported on Windows; fall back to a
+            # plain handler that hands the wakeup back to the loop thread.
+            signal.signal(sig, lambda s, f: loop.call_soon_threadsafe(request_shutdown))
+
+
+async def run_scrape():
+    """Scrape current products while loading the previous state."""
+    logger.info("Starting scrape cycle")
     
     # Initialize components
-    scraper = Scraper(config.site_config, config.headless_browser)
-    storage = Storage(config.state_file)
+    config = get_config()
+    scraper = Scraper(config.site_config, config.headless_browser, config.browser_state_file)
+    storage = get_storage(config.state_file)
     
-    # Load previous state
-    previous_state = storage.load_state()
-    previous_products = storage.get_products_from_state(previous_state)
+    # Load previous state in a worker thread while the browser navigates
+    previous_task = asyncio.create_task(asyncio.to_thread(storage.load_state))
     
     # Scrape current products
-    logger.info(f"Scraping {config.site_config['name']}...")
-    current_products = scraper.scrape()
+    logger.info("Scraping %s...", config.site_config['name'])
+    # Reuse one browser across cycles instead of relaunching it every time
+    current_products = await scraper.scrape(get_browser_pool(config.headless_browser))
+    
+    previous_state = await previous_task
+    previous_products = storage.get_products_from_state(previous_state)
     
     return previous_products, current_products
 
 
-async def run_scrape_cycle():
+async def run_scrape_cycle(notifier: TelegramNotifier):
     """Run a single scrape, compare, and notify cycle."""
+    config = get_config()
     try:
-        # Run scraping in sync context
-        previous_products, current_products = await asyncio.to_thread(run_scrape_cycle_sync)
+        previous_products, current_products = await run_scrape()
         
         if not current_products:
             logger.warning("No products found in current scrape")
             return
         
-        logger.info(f"Found {len(current_products)} products")
+        logger.info("Found %s products", len(current_products))
         
-        # Initialize notifier and storage
-        notifier = TelegramNotifier(config.telegram_bot_token, config.telegram_chat_id)
-        storage = Storage(config.state_file)
+        storage = get_storage(config.state_file)
         
         # Compare with previous state
         if Differ.is_first_run(previous_products):
@@ -81,35 +96,65 @@ async def run_scrape_cycle():
             diff = Differ.compare(previous_products, current_products)
             
             if diff.has_changes():
-                logger.info(f"Changes detected: {diff.get_summary()}")
+                logger.info("Changes detected: %s", diff)
                 
                 # Send notifications
                 await notifier.send_diff_notifications(diff, config.site_config['name'])
             else:
                 logger.info("No changes detected")
         
-        # Save current state
+        # Save current state, skipping the write when SKUs and prices are unchanged
         products_dict = [p.to_dict() for p in current_products]
-        storage.save_state(products_dict)
+        if Storage.fingerprint(products_dict) == Storage.fingerprint(previous_products):
+            logger.info("State unchanged, skipping save")
+        else:
+            storage.save_state(products_dict)
         
         logger.info("Scrape cycle completed successfully")
         
     except Exception as e:
-        logger.error(f"Error during scrape cycle: {e}", exc_info=True)
+        logger.error("Error during scrape cycle: %s", e, exc_info=True)
         
         # Try to send error notification
         try:
-            notifier = TelegramNotifier(config.telegram_bot_token, config.telegram_chat_id)
             await notifier.send_error_notification(str(e))
         except Exception as notify_error:
-            logger.error(f"Could not send error notification: {notify_error}")
+            logger.error("Could not send error notification: %s", notify_error)
+
+
+async def sleep_or_stop(stop_event: asyncio.Event, timeout: float) -> bool:
+    """Sleep for timeout seconds, waking early if shutdown is requested.
+    
+    Returns:
+        True if shutdown was requested
+    """
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def run_cancellable_cycle(notifier: TelegramNotifier):
+    """Run a scrape cycle as a task that a shutdown signal can cancel."""
+    global active_cycle
+    task = asyncio.create_task(run_scrape_cycle(notifier))
+    active_cycle = task
+    try:
+        await asyncio.wait({task})
+    finally:
+        active_cycle = None
+    
+    if task.cancelled():
+        logger.info("Scrape cycle cancelled for shutdown")
+    else:
+        task.result()
 
 
-async def test_telegram_connection():
+async def test_telegram_connection(notifier: TelegramNotifier):
     """Test Telegram bot connection and send test message."""
     try:
         logger.info("Testing Telegram connection...")
-        notifier = TelegramNotifier(config.telegram_bot_token, config.telegram_chat_id)
         success = await notifier.send_test_message()
         
         if success:
@@ -119,66 +164,80 @@ async def test_telegram_connection():
             logger.error("Telegram connection test failed")
             return False
     except Exception as e:
-        logger.error(f"Error testing Telegram connection: {e}")
+        logger.error("Error testing Telegram connection: %s", e)
         return False
 
 
 async def main():
     """Main function with scheduling loop."""
-    global running
-    
-    # Register signal handler for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Register signal handlers for graceful shutdown
+    stop_event = asyncio.Event()
+    install_signal_handlers(stop_event)
     
     logger.info("=" * 50)
     logger.info("Generic Scraper Notifier Starting")
     logger.info("=" * 50)
     
-    # Validate configuration
+    # Load and validate configuration
     try:
+        config = get_config()
         config.validate()
+        validate_site_config(config.site_config)
         logger.info("Configuration validated successfully")
     except Exception as e:
-        logger.error(f"Configuration validation failed: {e}")
+        logger.error("Configuration validation failed: %s", e)
         sys.exit(1)
     
-    # Test Telegram connection
-    telegram_ok = await test_telegram_connection()
-    if not telegram_ok:
-        logger.error("Telegram connection failed. Please check your bot token and chat ID.")
-        sys.exit(1)
-    
-    logger.info(f"Monitoring: {config.site_config['name']}")
-    logger.info(f"URL: {config.site_config['url']}")
-    logger.info(f"Check interval: {config.check_interval} seconds")
-    logger.info("Press Ctrl+C to stop")
-    logger.info("=" * 50)
-    
-    # Run first cycle immediately
-    await run_scrape_cycle()
-    
-    # Schedule regular runs
-    while running:
-        try:
-            # Wait for the check interval
-            for _ in range(config.check_interval):
-                if not running:
+    # Shared notifier so every cycle reuses the same pooled connections
+    notifier = TelegramNotifier(config.telegram_bot_token, config.telegram_chat_id,
+                                config.telegram_concurrency)
+    try:
+        # Test Telegram connection
+        telegram_ok = await test_telegram_connection(notifier)
+        if not telegram_ok:
+            logger.error("Telegram connection failed. Please check your bot token and chat ID.")
+            sys.exit(1)
+        
+        logger.info("Monitoring: %s", config.site_config['name'])
+        logger.info("URL: %s", config.site_config['url'])
+        logger.info("Check interval: %s seconds", config.check_interval)
+        logger.info("Press Ctrl+C to stop")
+        logger.info("=" * 50)
+        
+        # Run first cycle immediately, unless a signal already arrived during
+        # startup (e.g. while the Telegram test was backing off)
+        if not stop_event.is_set():
+            await run_cancellable_cycle(notifier)
+        
+        # Schedule regular runs
+        while not stop_event.is_set():
+            try:
+                # Wait for the check interval, waking immediately on shutdown
+                if await sleep_or_stop(stop_event, config.check_interval):
                     break
-                await asyncio.sleep(1)
-            
-            if running:
-                await run_scrape_cycle()
                 
-        except Exception as e:
-            logger.error(f"Error in main loop: {e}", exc_info=True)
-            # Wait a bit before retrying
-            await asyncio.sleep(60)
+                await run_cancellable_cycle(notifier)
+                
+            except Exception as e:
+                logger.error("Error in main loop: %s", e, exc_info=True)
+                # Wait a bit before retrying
+                if await sleep_or_stop(stop_event, 60):
+                    break
+    finally:
+        await notifier.aclose()
+        await get_browser_pool(config.headless_browser).close()
     
     logger.info("Scraper stopped")
 
 
 if __name__ == "__main__":
+    # Use the faster uvloop event loop where available
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     # Run the async main function
     try:
         asyncio.run(main())
@@ -186,6 +245,6 @@ if __name__ == "__main__":
         logger.info("Interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
@@ -4,9 +4,9 @@ import logging
 import sys
 from datetime import datetime
 
-from src.config import config
-from src.scraper import Scraper
-from src.storage import Storage
+from src.config import get_config
+from src.scraper import Scraper, validate_site_config
+from src.storage import Storage, get_storage
 from src.differ import Differ
 from src.notifier import TelegramNotifier
 
@@ -20,29 +20,40 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_scrape_sync():
-    """Run scraping synchronously."""
+async def run_scrape():
+    """Scrape current products while loading the previous state."""
     logger.info("Starting scrape cycle")
     
-    scraper = Scraper(config.site_config, config.headless_browser)
-    storage = Storage(config.state_file)
+    config = get_config()
+    scraper = Scraper(config.site_config, config.headless_browser, config.browser_state_file)
+    storage = get_storage(config.state_file)
     
-    previous_state = storage.load_state()
-    previous_products = storage.get_products_from_state(previous_state)
+    # Load previous state in a worker thread while the browser navigates
+    previous_task = asyncio.create_task(asyncio.to_thread(storage.load_state))
+    
+    logger.info("Scraping %s...", config.site_config['name'])
+    current_products = await scraper.scrape()
     
-    logger.info(f"Scraping {config.site_config['name']}...")
-    current_products = scraper.scrape()
+    previous_state = await previous_task
+    previous_products = storage.get_products_from_state(previous_state)
     
     return previous_products, current_products
 
 
 async def main():
     """Main function for single run."""
+    # Configuration errors aren't transient; fail the run so they get noticed
     try:
+        config = get_config()
         config.validate()
-        
+        validate_site_config(config.site_config)
+    except Exception as e:
+        logger.error("Configuration validation failed: %s", e)
+        return False
+    
+    try:
         # Run scraping
-        previous_products, current_products = await asyncio.to_thread(run_scrape_sync)
+        previous_products, current_products = await run_scrape()
         
         if not current_products:
             # An empty scrape is almost always a transient failure, not the page
@@ -51,11 +62,10 @@ async def main():
             logger.warning("No products found; skipping this run (state preserved)")
             return True
 
-        logger.info(f"Found {len(current_products)} products")
+        logger.info("Found %s products", len(current_products))
         
         # Initialize components
-        notifier = TelegramNotifier(config.telegram_bot_token, config.telegram_chat_id)
-        storage = Storage(config.state_file)
+        storage = get_storage(config.state_file)
         
         # Compare and notify
         if Differ.is_first_run(previous_products):
@@ -64,14 +74,22 @@ async def main():
             diff = Differ.compare(previous_products, current_products)
             
             if diff.has_changes():
-                logger.info(f"Changes detected: {diff.get_summary()}")
-                await notifier.send_diff_notifications(diff, config.site_config['name'])
+                logger.info("Changes detected: %s", diff)
+                notifier = TelegramNotifier(config.telegram_bot_token, config.telegram_chat_id,
+                                            config.telegram_concurrency)
+                try:
+                    await notifier.send_diff_notifications(diff, config.site_config['name'])
+                finally:
+                    await notifier.aclose()
             else:
                 logger.info("No changes detected")
         
-        # Save state
+        # Save state, skipping the write when SKUs and prices are unchanged
         products_dict = [p.to_dict() for p in current_products]
-        storage.save_state(products_dict)
+        if Storage.fingerprint(products_dict) == Storage.fingerprint(previous_products):
+            logger.info("State unchanged, skipping save")
+        else:
+            storage.save_state(products_dict)
         
         logger.info("Scrape completed successfully")
         return True
@@ -80,11 +98,18 @@ async def main():
         # Transient scrape failures (e.g. a slow render that exhausted retries)
         # shouldn't mark the scheduled run as failed or spam an error alert every
         # 5 minutes. Log it and exit cleanly; the next run will retry.
-        logger.warning(f"Scrape failed transiently, skipping this run: {e}")
+        logger.warning("Scrape failed transiently, skipping this run: %s", e)
         return True
 
 
 if __name__ == "__main__":
+    # Use the faster uvloop event loop where available
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
 
@@ -1,12 +1,20 @@
 """Configuration module for loading environment variables and site configs."""
 import os
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Set
+
+import orjson
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Directories already created by this process
+_MKDIR_CACHE: Set[str] = set()
+
+
+@lru_cache(maxsize=8)
+def _load_site_config_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a site config file, memoized on path and modification time."""
+    return orjson.loads(Path(path).read_bytes())
 
 
 class Config:
@@ -17,6 +25,7 @@ class Config:
         # Telegram settings
         self.telegram_bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.telegram_chat_id = os.getenv('TELEGRAM_CHAT_ID')
+        self.telegram_concurrency = int(os.getenv('TG_CONCURRENCY', '5'))
         
         # Scraper settings
         self.check_interval = int(os.getenv('CHECK_INTERVAL', '300'))
@@ -27,8 +36,12 @@ class Config:
         
         # Data directory
         self.data_dir = Path('data')
-        self.data_dir.mkdir(exist_ok=True)
+        key = str(self.data_dir)
+        if key not in _MKDIR_CACHE:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            _MKDIR_CACHE.add(key)
         self.state_file = self.data_dir / 'products_state.json'
+        self.browser_state_file = self.data_dir / 'browser_state.json'
         
         # Load site configuration
         self.site_config = self._load_site_config()
@@ -39,8 +52,7 @@ class Config:
         if not config_path.exists():
             raise FileNotFoundError(f"Site config not found: {config_path}")
         
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return _load_site_config_cached(str(config_path), config_path.stat().st_mtime)
     
     def validate(self) -> bool:
         """Validate that all required configuration is present."""
@@ -53,6 +65,10 @@ class Config:
         return True
 
 
-# Global config instance
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, building it on first use."""
+    # Load environment variables from .env file
+    load_dotenv()
+    return Config()
 
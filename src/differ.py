@@ -14,6 +14,21 @@ class ProductDiff:
         self.removed_products: List[Product] = []
         self.price_changes: List[Dict[str, Any]] = []
     
+    @property
+    def n_new(self) -> int:
+        """Number of new products."""
+        return len(self.new_products)
+    
+    @property
+    def n_removed(self) -> int:
+        """Number of removed products."""
+        return len(self.removed_products)
+    
+    @property
+    def n_price(self) -> int:
+        """Number of price changes."""
+        return len(self.price_changes)
+    
     def has_changes(self) -> bool:
         """Check if there are any changes.
         
@@ -29,17 +44,18 @@ class ProductDiff:
             String summary
         """
         parts = []
-        if self.new_products:
-            parts.append(f"{len(self.new_products)} new")
-        if self.removed_products:
-            parts.append(f"{len(self.removed_products)} removed")
-        if self.price_changes:
-            parts.append(f"{len(self.price_changes)} price changes")
+        if self.n_new:
+            parts.append(f"{self.n_new} new")
+        if self.n_removed:
+            parts.append(f"{self.n_removed} removed")
+        if self.n_price:
+            parts.append(f"{self.n_price} price changes")
         
-        if not parts:
-            return "No changes"
-        
-        return ", ".join(parts)
+        return ", ".join(parts) if parts else "No changes"
+    
+    def __str__(self) -> str:
+        """Summary string, so a diff can be passed straight to lazy logging."""
+        return self.get_summary()
 
 
 class Differ:
@@ -59,33 +75,37 @@ class Differ:
         """
         diff = ProductDiff()
         
-        # Convert previous products to Product objects for easier comparison
-        previous = {p['sku']: Product.from_dict(p) for p in previous_products}
-        current = {p.sku: p for p in current_products}
+        # Index previous products by SKU, keeping the raw dicts so unchanged
+        # products never need to be rebuilt as Product objects
+        previous = {p['sku']: p for p in previous_products}
+        current = {p.sku: p for p in current_products}  # dedupe repeated listings
         
-        # Find new products
-        new_skus = set(current.keys()) - set(previous.keys())
-        diff.new_products = [current[sku] for sku in new_skus]
-        
-        # Find removed products
-        removed_skus = set(previous.keys()) - set(current.keys())
-        diff.removed_products = [previous[sku] for sku in removed_skus]
-        
-        # Find price changes
-        common_skus = set(current.keys()) & set(previous.keys())
-        for sku in common_skus:
-            prev_product = previous[sku]
-            curr_product = current[sku]
-            
-            if prev_product.price != curr_product.price:
-                diff.price_changes.append({
+        # Single pass: anything not seen before is new, anything seen is
+        # checked for a price change and popped so the leftovers are removed.
+        # Method lookups are hoisted out of the loop for large catalogs.
+        pop_previous = previous.pop
+        add_new = diff.new_products.append
+        add_price_change = diff.price_changes.append
+        price_cents_from_dict = Product.price_cents_from_dict
+        for sku, curr_product in current.items():
+            prev_product = pop_previous(sku, None)
+            if prev_product is None:
+                add_new(curr_product)
+                continue
+            old_cents = price_cents_from_dict(prev_product)
+            new_cents = curr_product.price_cents
+            if old_cents != new_cents:
+                add_price_change({
                     'product': curr_product,
-                    'old_price': prev_product.price,
-                    'new_price': curr_product.price,
-                    'change': curr_product.price - prev_product.price
+                    'old_price': old_cents / 100,
+                    'new_price': new_cents / 100,
+                    'change': (new_cents - old_cents) / 100
                 })
         
-        logger.info(f"Diff results: {diff.get_summary()}")
+        # Whatever is left was not in the current scrape
+        diff.removed_products = [Product.from_dict(p) for p in previous.values()]
+        
+        logger.info("Diff results: %s", diff)
         
         return diff
     
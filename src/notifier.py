@@ -1,30 +1,82 @@
 """Notifier module for sending Telegram notifications."""
+import asyncio
+import html
 import logging
+import random
 from typing import Dict, Any
 from telegram import Bot
-from telegram.error import TelegramError
+from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
 from src.scraper import Product
 from src.differ import ProductDiff
 
 logger = logging.getLogger(__name__)
 
+# Telegram caps messages at 4096 characters; leave headroom for the header
+MAX_MESSAGE_LENGTH = 3800
+
+# Number of new products sent individually with their image
+MAX_HERO_PHOTOS = 3
+
+# Retry policy for transient Telegram failures (rate limits, timeouts, 5xx)
+SEND_ATTEMPTS = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+# Message templates, filled with str.format_map
+_NEW_TMPL = (
+    "🆕 New {site} Product!\n\n"
+    "{title}\n"
+    "💰 {price}\n"
+    "🏷️ SKU: {sku}\n\n"
+    "🔗 <a href='{url}'>View Product</a>"
+)
+_BATCH_HEADER_TMPL = "📋 {site} Updates\n\n"
+_NEW_LINE_TMPL = "🆕 <a href='{url}'>{title}</a> {price} (SKU: {sku})\n"
+_REMOVED_LINE_TMPL = "❌ {title} (SKU: {sku})\n"
+_PRICE_LINE_TMPL = "{emoji} <a href='{url}'>{title}</a> {old} → {new} ({sign}{change})\n"
+
+
+def _format_price(value: float) -> str:
+    """Format a price for display, e.g. $6,554.05."""
+    return f"${value:,.2f}"
+
 
 class TelegramNotifier:
     """Send notifications via Telegram Bot API."""
     
-    def __init__(self, bot_token: str, chat_id: str):
+    def __init__(self, bot_token: str, chat_id: str, concurrency: int = 5):
         """Initialize Telegram notifier.
         
         Args:
             bot_token: Telegram bot token
             chat_id: Telegram chat ID to send messages to
+            concurrency: Maximum number of requests in flight at once
         """
-        self.bot = Bot(token=bot_token)
+        # One pooled keep-alive client shared by every request this bot makes
+        self._request = HTTPXRequest(
+            connection_pool_size=concurrency,
+            connect_timeout=5,
+            read_timeout=10,
+            pool_timeout=1
+        )
+        self.bot = Bot(token=bot_token, request=self._request)
         self.chat_id = chat_id
+        self._sem = asyncio.Semaphore(concurrency)
+    
+    async def aclose(self):
+        """Close the pooled HTTP connections."""
+        await self._request.shutdown()
     
     async def send_diff_notifications(self, diff: ProductDiff, site_name: str = "Products"):
         """Send notifications for all changes in diff.
         
+        The first few new products are sent individually with their image;
+        everything else is batched into as few text messages as possible so
+        a large diff costs a handful of API calls rather than one per product.
+        The image sends overlap each other; the text batches then go out one
+        after another so the chat reads new, removed, then price changes.
+        
         Args:
             diff: ProductDiff object containing changes
             site_name: Name of the site being monitored
@@ -33,19 +85,124 @@ class TelegramNotifier:
             logger.info("No changes to notify")
             return
         
-        logger.info(f"Sending notifications for: {diff.get_summary()}")
+        logger.info("Sending notifications for: %s", diff)
+        
+        # Image notifications for the first few new products, overlapped and
+        # bounded to stay under Telegram's rate limit
+        tasks = [
+            asyncio.create_task(self._guarded(self._send_new_product_notification(product, site_name)))
+            for product in diff.new_products[:MAX_HERO_PHOTOS]
+        ]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Batch the remaining changes into text messages
+        lines = [self._format_new_line(p) for p in diff.new_products[MAX_HERO_PHOTOS:]]
+        lines += [self._format_removed_line(p) for p in diff.removed_products]
+        lines += [self._format_price_line(c) for c in diff.price_changes]
+        
+        header = _BATCH_HEADER_TMPL.format_map({'site': site_name})
+        batches = []
+        parts = []
+        size = len(header)
+        for line in lines:
+            if parts and size + len(line) > MAX_MESSAGE_LENGTH:
+                batches.append(header + "".join(parts))
+                parts = []
+                size = len(header)
+            parts.append(line)
+            size += len(line)
+        if parts:
+            batches.append(header + "".join(parts))
+        
+        # Sequential, so a change list split across messages arrives in order
+        for message in batches:
+            await self._send_batch(message)
+    
+    async def _guarded(self, coro):
+        """Run a send coroutine while holding the concurrency semaphore."""
+        async with self._sem:
+            await coro
+    
+    async def _send_reliable(self, method: str, **kwargs):
+        """Call a Bot send method, retrying transient failures with backoff.
         
-        # Send notifications for new products
-        for product in diff.new_products:
-            await self._send_new_product_notification(product, site_name)
+        Rate limits wait for the delay Telegram asks for; network errors back
+        off exponentially with jitter. Bad requests are never retried.
         
-        # Send notifications for removed products
-        for product in diff.removed_products:
-            await self._send_removed_product_notification(product, site_name)
+        Args:
+            method: Name of the Bot method, e.g. 'send_message'
+            **kwargs: Arguments for the method, excluding chat_id
+            
+        Raises:
+            TelegramError: If the send still fails after all attempts
+        """
+        send = getattr(self.bot, method)
+        for attempt in range(1, SEND_ATTEMPTS + 1):
+            try:
+                return await send(chat_id=self.chat_id, **kwargs)
+            except RetryAfter as e:
+                if attempt == SEND_ATTEMPTS:
+                    raise
+                delay = e.retry_after
+            except BadRequest:
+                raise
+            except NetworkError:
+                if attempt == SEND_ATTEMPTS:
+                    raise
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1)) + random.uniform(0, 1)
+            logger.warning("Telegram %s attempt %s/%s failed, retrying in %.1fs",
+                           method, attempt, SEND_ATTEMPTS, delay)
+            await asyncio.sleep(delay)
+    
+    async def _send_batch(self, message: str):
+        """Send a batched text message of change lines.
         
-        # Send notifications for price changes
-        for change in diff.price_changes:
-            await self._send_price_change_notification(change, site_name)
+        Args:
+            message: HTML formatted message
+        """
+        try:
+            await self._send_reliable(
+                'send_message',
+                text=message,
+                parse_mode='HTML',
+                disable_web_page_preview=True
+            )
+            logger.info("Sent batched notification (%s chars)", len(message))
+        except TelegramError as e:
+            logger.error("Error sending batched notification: %s", e)
+    
+    @staticmethod
+    def _format_new_line(product: Product) -> str:
+        """Format a new product as a single batched line."""
+        return _NEW_LINE_TMPL.format_map({
+            'url': product.url,
+            'title': html.escape(product.title),
+            'price': _format_price(product.price),
+            'sku': product.sku
+        })
+    
+    @staticmethod
+    def _format_removed_line(product: Product) -> str:
+        """Format a removed product as a single batched line."""
+        return _REMOVED_LINE_TMPL.format_map({
+            'title': html.escape(product.title),
+            'sku': product.sku
+        })
+    
+    @staticmethod
+    def _format_price_line(change: Dict[str, Any]) -> str:
+        """Format a price change as a single batched line."""
+        product = change['product']
+        price_change = change['change']
+        return _PRICE_LINE_TMPL.format_map({
+            'emoji': "📈" if price_change > 0 else "📉",
+            'url': product.url,
+            'title': html.escape(product.title),
+            'old': _format_price(change['old_price']),
+            'new': _format_price(change['new_price']),
+            'sign': "+" if price_change > 0 else "-",
+            'change': _format_price(abs(price_change))
+        })
     
     async def _send_new_product_notification(self, product: Product, site_name: str):
         """Send notification for a new product.
@@ -55,100 +212,38 @@ class TelegramNotifier:
             site_name: Name of the site
         """
         # Format price display
-        price_display = f"${product.price:,.2f}"
+        price_display = _format_price(product.price)
         if product.original_price and product.original_price > product.price:
-            price_display += f" (was ${product.original_price:,.2f})"
-        
-        message = (
-            f"🆕 New {site_name} Product!\n\n"
-            f"{product.title}\n"
-            f"💰 {price_display}\n"
-            f"🏷️ SKU: {product.sku}\n\n"
-            f"🔗 <a href='{product.url}'>View Product</a>"
-        )
+            price_display += f" (was {_format_price(product.original_price)})"
+        
+        message = _NEW_TMPL.format_map({
+            'site': site_name,
+            'title': product.title,
+            'price': price_display,
+            'sku': product.sku,
+            'url': product.url
+        })
         
         try:
             if product.image:
                 # Send with image
-                await self.bot.send_photo(
-                    chat_id=self.chat_id,
+                await self._send_reliable(
+                    'send_photo',
                     photo=product.image,
                     caption=message,
                     parse_mode='HTML'
                 )
             else:
                 # Send text only
-                await self.bot.send_message(
-                    chat_id=self.chat_id,
+                await self._send_reliable(
+                    'send_message',
                     text=message,
                     parse_mode='HTML',
                     disable_web_page_preview=False
                 )
-            logger.info(f"Sent new product notification for SKU {product.sku}")
-        except TelegramError as e:
-            logger.error(f"Error sending new product notification: {e}")
-    
-    async def _send_removed_product_notification(self, product: Product, site_name: str):
-        """Send notification for a removed product.
-        
-        Args:
-            product: Product object
-            site_name: Name of the site
-        """
-        message = (
-            f"❌ Product No Longer Available\n\n"
-            f"{product.title}\n"
-            f"🏷️ SKU: {product.sku}\n"
-        )
-        
-        try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode='HTML'
-            )
-            logger.info(f"Sent removed product notification for SKU {product.sku}")
-        except TelegramError as e:
-            logger.error(f"Error sending removed product notification: {e}")
-    
-    async def _send_price_change_notification(self, change: Dict[str, Any], site_name: str):
-        """Send notification for a price change.
-        
-        Args:
-            change: Dictionary with product, old_price, new_price, change
-            site_name: Name of the site
-        """
-        product = change['product']
-        old_price = change['old_price']
-        new_price = change['new_price']
-        price_change = change['change']
-        
-        # Determine if price increased or decreased
-        if price_change > 0:
-            emoji = "📈"
-            change_text = f"+${abs(price_change):,.2f}"
-        else:
-            emoji = "📉"
-            change_text = f"-${abs(price_change):,.2f}"
-        
-        message = (
-            f"💲 Price Update!\n\n"
-            f"{product.title}\n"
-            f"{emoji} ${old_price:,.2f} → ${new_price:,.2f} ({change_text})\n"
-            f"🏷️ SKU: {product.sku}\n\n"
-            f"🔗 <a href='{product.url}'>View Product</a>"
-        )
-        
-        try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode='HTML',
-                disable_web_page_preview=False
-            )
-            logger.info(f"Sent price change notification for SKU {product.sku}")
+            logger.info("Sent new product notification for SKU %s", product.sku)
         except TelegramError as e:
-            logger.error(f"Error sending price change notification: {e}")
+            logger.error("Error sending new product notification: %s", e)
     
     async def send_test_message(self):
         """Send a test message to verify bot configuration.
@@ -159,14 +254,14 @@ class TelegramNotifier:
         message = "✅ Generic Scraper Notifier is running!"
         
         try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
+            await self._send_reliable(
+                'send_message',
                 text=message
             )
             logger.info("Test message sent successfully")
             return True
         except TelegramError as e:
-            logger.error(f"Error sending test message: {e}")
+            logger.error("Error sending test message: %s", e)
             return False
     
     async def send_error_notification(self, error_message: str):
@@ -178,12 +273,12 @@ class TelegramNotifier:
         message = f"⚠️ Scraper Error\n\n{error_message}"
         
         try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
+            await self._send_reliable(
+                'send_message',
                 text=message,
                 parse_mode='HTML'
             )
             logger.info("Error notification sent")
         except TelegramError as e:
-            logger.error(f"Error sending error notification: {e}")
+            logger.error("Error sending error notification: %s", e)
 
@@ -1,31 +1,203 @@
 """Web scraper module using Playwright for JavaScript-rendered pages."""
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeoutError
+import re
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import httpx
+import orjson
+from playwright.async_api import (
+    async_playwright, Browser, BrowserContext, Page, Playwright, Response, Route,
+    TimeoutError as PlaywrightTimeoutError
+)
 
 logger = logging.getLogger(__name__)
 
+# A whole price string: an optional currency sign, then an amount with optional
+# thousands separators, e.g. "$6,554.05", "AU$1,299" or "$.99". Anything else
+# around the amount means the text isn't a price, so the next selector is tried.
+_PRICE_RE = re.compile(r'\s*(?:[A-Z]{0,3}\$)?\s*((?:\d[\d,]*)?\.?\d+)\s*')
+
+# Chromium subsystems a headless scraper never uses. /dev/shm is tiny on CI
+# runners and in containers, so shared memory goes to /tmp instead.
+CHROMIUM_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-translate',
+    '--disable-features=TranslateUI',
+]
+
+# Request types never needed for extraction. Image URLs are read from the
+# src attribute, so the pixels themselves don't have to load. Stylesheets are
+# kept since innerText depends on layout.
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+# Tracker/ad hosts, matched against the request host and its parent domains
+BLOCKED_HOSTS = frozenset({
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+})
+
+
+async def _block_unneeded_requests(route: Route):
+    """Abort requests for resources the scraper never reads."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+    
+    host = urlsplit(request.url).hostname or ''
+    parts = host.split('.')
+    if any('.'.join(parts[i:]) in BLOCKED_HOSTS for i in range(len(parts) - 1)):
+        await route.abort()
+        return
+    
+    await route.continue_()
+
+
+# Reads the raw fields of every matched product container in a single call. The
+# result comes back as one JSON string, which is much cheaper to transfer and
+# parse than Playwright's per-value serialization of a large list of objects.
+_EXTRACT_PRODUCTS_JS = """(els, {selectors, price_selectors}) => {
+    const text = (el, sel) => {
+        const node = sel ? el.querySelector(sel) : null;
+        return node ? node.innerText.trim() : null;
+    };
+    // new URL() throws on malformed hrefs; one bad link mustn't fail the batch
+    const absolute = href => {
+        try {
+            return new URL(href, location.href).href;
+        } catch (e) {
+            return href;
+        }
+    };
+    const priceText = (el, sel) => {
+        const node = el.querySelector(sel);
+        if (!node) return null;
+        return node.tagName === 'META' ? node.getAttribute('content') : node.innerText.trim();
+    };
+    return JSON.stringify(els.map(el => {
+        const link = el.querySelector(selectors.url);
+        const image = el.querySelector(selectors.image);
+        const href = link ? link.getAttribute('href') : null;
+        const url = href ? absolute(href) : null;
+        return {
+            has_url: link !== null,
+            url: url,
+            sku: (link && link.getAttribute('data-objectid')) || (url ? url.split('/').pop() : 'unknown'),
+            title: text(el, selectors.title),
+            prices: price_selectors.map(sel => priceText(el, sel)),
+            original_price: text(el, selectors.original_price),
+            image: image ? image.getAttribute('src') : null,
+            discount: text(el, selectors.discount),
+        };
+    }));
+}"""
+
+
+def _json_path(data: Any, path: str) -> Any:
+    """Follow a dotted path like 'results.0.hits' through parsed JSON.
+    
+    Returns:
+        The value at the path, or None if any step is missing
+    """
+    for key in path.split('.') if path else ():
+        try:
+            data = data[int(key)] if isinstance(data, list) else data[key]
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+    return data
 
+
+# True once the number of elements matching a selector is the same on two
+# consecutive polls, or has stayed at zero for empty_polls polls in a row (an
+# empty listing, which the old fixed 3 s render wait also returned quickly)
+_STABLE_COUNT_JS = """({sel, empty_polls}) => {
+    const n = document.querySelectorAll(sel).length;
+    window.__sameN = window.__lastN === n ? (window.__sameN || 0) + 1 : 0;
+    window.__lastN = n;
+    return n > 0 ? window.__sameN >= 1 : window.__sameN >= empty_polls;
+}"""
+
+# Polls of the stability check (250 ms apart) a zero count must hold for
+_EMPTY_SETTLE_POLLS = 12
+
+
+@dataclass(slots=True, eq=False)
 class Product:
-    """Product data class."""
-    
-    def __init__(self, sku: str, title: str, price: float, original_price: Optional[float],
-                 url: str, image: str, discount: Optional[str] = None):
-        self.sku = sku
-        self.title = title
-        self.price = price
-        self.original_price = original_price
-        self.url = url
-        self.image = image
-        self.discount = discount
+    """Product data class.
+    
+    Prices are held as integer cents so comparisons are exact; the float
+    ``price``/``original_price`` properties are for display. Slots keep
+    the per-instance footprint small, since a scrape can hold thousands.
+    Equality and hashing are by SKU only.
+    """
+    
+    sku: str
+    title: str
+    price_cents: int
+    original_price_cents: Optional[int]
+    url: str
+    image: str
+    discount: Optional[str] = None
+    _hash: int = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # SKUs are the identity used by every set/dict lookup; interning makes
+        # equal SKUs the same object and the hash is computed once up front
+        self.sku = sys.intern(self.sku)
+        self._hash = hash(self.sku)
+    
+    @property
+    def price(self) -> float:
+        """Price in dollars."""
+        return self.price_cents / 100
+    
+    @property
+    def original_price(self) -> Optional[float]:
+        """Original price in dollars, if the product is discounted."""
+        if self.original_price_cents is None:
+            return None
+        return self.original_price_cents / 100
+    
+    @staticmethod
+    def to_cents(value: Optional[float]) -> Optional[int]:
+        """Convert a dollar amount to integer cents."""
+        if value is None:
+            return None
+        return round(value * 100)
+    
+    @classmethod
+    def price_cents_from_dict(cls, data: Dict[str, Any], key: str = 'price') -> Optional[int]:
+        """Read a price in cents from a product dictionary.
+        
+        State saved before prices were stored as cents holds float dollars
+        under the bare key, so fall back to converting that.
+        """
+        cents = data.get(f'{key}_cents')
+        if cents is None:
+            cents = cls.to_cents(data.get(key))
+        return cents
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert product to dictionary."""
         return {
             'sku': self.sku,
             'title': self.title,
-            'price': self.price,
-            'original_price': self.original_price,
+            'price_cents': self.price_cents,
+            'original_price_cents': self.original_price_cents,
             'url': self.url,
             'image': self.image,
             'discount': self.discount
@@ -37,8 +209,8 @@ class Product:
         return cls(
             sku=data['sku'],
             title=data['title'],
-            price=data['price'],
-            original_price=data.get('original_price'),
+            price_cents=cls.price_cents_from_dict(data),
+            original_price_cents=cls.price_cents_from_dict(data, 'original_price'),
             url=data['url'],
             image=data['image'],
             discount=data.get('discount')
@@ -52,218 +224,555 @@ class Product:
     
     def __hash__(self):
         """Hash product by SKU."""
-        return hash(self.sku)
+        return self._hash
+
+
+class BrowserPool:
+    """Long-lived Chromium instance that hands out a fresh page per scrape.
+    
+    Launching Chromium costs a second or two, and a new BrowserContext still
+    costs tens of milliseconds. Pages are therefore opened in a shared
+    context, which is replaced after ``pages_per_context`` pages so cookies
+    and cache don't accumulate indefinitely.
+    """
+    
+    def __init__(self, headless: bool = True, pages_per_context: int = 20):
+        """Initialize the pool; the browser is launched on first use.
+        
+        Args:
+            headless: Whether to run browser in headless mode
+            pages_per_context: Pages to open in a context before replacing it
+        """
+        self.headless = headless
+        self.pages_per_context = pages_per_context
+        self._pw: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+        # Current context per storage state file, with the pages opened in it
+        self._contexts: Dict[Optional[Path], Tuple[BrowserContext, int]] = {}
+        # Pages still open per context; a replaced context closes with its last page
+        self._open_pages: Dict[BrowserContext, int] = {}
+    
+    async def _get_browser(self) -> Browser:
+        """Return the shared browser, (re)launching it if needed."""
+        if self._browser is None or not self._browser.is_connected():
+            if self._pw is None:
+                self._pw = await async_playwright().start()
+            logger.info("Launching browser...")
+            self._browser = await self._pw.chromium.launch(
+                headless=self.headless,
+                args=CHROMIUM_ARGS
+            )
+            # Contexts of a crashed browser are gone with it
+            self._contexts.clear()
+            self._open_pages.clear()
+        return self._browser
+    
+    async def _get_context(self, storage_state: Optional[Path]) -> BrowserContext:
+        """Return the current context for a storage state, rotating it if used up."""
+        async with self._lock:
+            browser = await self._get_browser()
+            context, served = self._contexts.get(storage_state, (None, 0))
+            if context is None or served >= self.pages_per_context:
+                if context is not None and context not in self._open_pages:
+                    await context.close()
+                context = await browser.new_context(
+                    viewport={'width': 1920, 'height': 1080},
+                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                    storage_state=storage_state if storage_state and storage_state.exists() else None,
+                    service_workers='block'
+                )
+                served = 0
+            self._contexts[storage_state] = (context, served + 1)
+            self._open_pages[context] = self._open_pages.get(context, 0) + 1
+            return context
+    
+    @asynccontextmanager
+    async def page(self, storage_state: Optional[Path] = None) -> AsyncIterator[Page]:
+        """Yield a new page in the shared context, closing it afterwards.
+        
+        Args:
+            storage_state: Saved cookies/local storage to start a new context
+                with, if the file exists
+        """
+        context = await self._get_context(storage_state)
+        try:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                await page.close()
+        finally:
+            await self._release(context, storage_state)
+    
+    async def _release(self, context: BrowserContext, storage_state: Optional[Path]):
+        """Account for a closed page, closing its context if it was replaced."""
+        open_pages = self._open_pages.get(context)
+        if open_pages is None:
+            return  # browser relaunched or pool closed in the meantime
+        if open_pages > 1:
+            self._open_pages[context] = open_pages - 1
+            return
+        del self._open_pages[context]
+        current = self._contexts.get(storage_state)
+        if current is None or current[0] is not context:
+            await context.close()
+    
+    async def close(self):
+        """Close the browser and stop Playwright."""
+        self._contexts.clear()
+        self._open_pages.clear()
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            await self._pw.stop()
+            self._pw = None
+
+
+@lru_cache(maxsize=None)
+def get_browser_pool(headless: bool = True) -> BrowserPool:
+    """Return the process-wide BrowserPool for a headless setting."""
+    return BrowserPool(headless)
+
+
+def validate_site_config(site_config: Dict[str, Any]):
+    """Check that a site config has the keys its scrape mode needs.
+    
+    Raises:
+        ValueError: If a required key is missing
+    """
+    required = [('url', site_config)]
+    api = site_config.get('api')
+    capture = site_config.get('capture_response')
+    if api is not None:
+        required += [('api.url', api), ('api.fields', api)]
+    else:
+        required += [('selectors', site_config), ('wait_for_selector', site_config)]
+        if 'selectors' in site_config:
+            required += [(f'selectors.{k}', site_config['selectors'])
+                         for k in ('product_container', 'price')]
+    if capture is not None:
+        required += [('capture_response.url_contains', capture), ('capture_response.fields', capture)]
+    
+    for name, block in required:
+        if name.rsplit('.', 1)[-1] not in block:
+            raise ValueError(f"Site config is missing '{name}'")
+
+
+# Recent scrape results, keyed by what determines them: key -> (expires_at, products)
+_scrape_cache: Dict[Tuple[str, bytes], Tuple[float, List[Product]]] = {}
+
+# Last ETag each api request was answered with: key -> (etag, products)
+_etag_cache: Dict[Tuple[str, bytes], Tuple[str, List[Product]]] = {}
 
 
 class Scraper:
     """Generic web scraper using Playwright."""
     
-    def __init__(self, site_config: Dict[str, Any], headless: bool = True):
+    def __init__(self, site_config: Dict[str, Any], headless: bool = True,
+                 storage_state: Optional[Path] = None):
         """Initialize scraper with site configuration.
         
         Args:
             site_config: Dictionary containing site-specific selectors and URLs
             headless: Whether to run browser in headless mode
+            storage_state: File to persist browser cookies in, so an accepted
+                cookie popup stays dismissed on later scrapes
         """
+        validate_site_config(site_config)
         self.site_config = site_config
         self.headless = headless
+        self.storage_state = storage_state
         self.url = site_config['url']
-        self.selectors = site_config['selectors']
-        self.wait_for_selector = site_config['wait_for_selector']
         self.wait_timeout = site_config.get('wait_timeout', 30000)
+        self.api = site_config.get('api')
+        self.capture = site_config.get('capture_response')
+        
+        # DOM settings are only needed when the page itself is loaded
+        if self.api is None:
+            self.selectors = site_config['selectors']
+            self.wait_for_selector = site_config['wait_for_selector']
+        else:
+            self.selectors = site_config.get('selectors', {})
+            self.wait_for_selector = site_config.get('wait_for_selector')
+        
+        # Seconds to reuse a previous result for; off by default so the
+        # monitoring loop always sees the live page
+        self.cache_ttl = site_config.get('cache_ttl', 0)
+        # The api request alone decides an api result (the page URL only
+        # resolves relative links); a DOM result depends on the selectors
+        self._api_key: Optional[Tuple[str, bytes]] = None
+        if self.api is not None:
+            self._api_key = (self.url, orjson.dumps(self.api, option=orjson.OPT_SORT_KEYS))
+            self._cache_key = self._api_key
+        else:
+            self._cache_key = (self.url, orjson.dumps(self.selectors, option=orjson.OPT_SORT_KEYS))
+        
+        # Scheme and host of the listing page, prefixed to relative JSON record links
+        self._base_url = urlsplit(self.url)._replace(path='', query='', fragment='').geturl()
+        
+        # Price selectors in fallback order, built once; dict.fromkeys drops
+        # the configured selector if it repeats one of the built-in fallbacks
+        self._price_selectors = list(dict.fromkeys(filter(None, [
+            self.selectors.get('price'),
+            'span.after_special.custom_final_price',
+            'span.custom_final_price.black-friday',
+            'span.custom_final_price',
+            'span.after_special',
+            'meta[itemprop="price"]'
+        ])))
+        self._extract_args = {'selectors': self.selectors, 'price_selectors': self._price_selectors}
     
-    def scrape(self) -> List[Product]:
+    @classmethod
+    async def scrape_many(cls, site_configs: List[Dict[str, Any]], headless: bool = True,
+                          max_concurrency: int = 5) -> List[Union[List[Product], BaseException]]:
+        """Scrape several sites concurrently through one shared browser.
+        
+        Args:
+            site_configs: Site configuration dictionaries to scrape
+            headless: Whether to run browser in headless mode
+            max_concurrency: Maximum number of sites loading at once
+            
+        Returns:
+            One entry per site config, in order: its product list, or the
+            exception that made it fail
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        pool = BrowserPool(headless)
+        
+        async def scrape_site(site_config: Dict[str, Any]) -> List[Product]:
+            async with sem:
+                return await cls(site_config, headless).scrape(pool)
+        
+        try:
+            return await asyncio.gather(
+                *(scrape_site(c) for c in site_configs),
+                return_exceptions=True
+            )
+        finally:
+            await pool.close()
+    
+    async def scrape(self, pool: Optional[BrowserPool] = None) -> List[Product]:
         """Scrape products, retrying on transient timeouts.
 
         The DigiDirect page renders fine the vast majority of the time, but
         occasionally takes longer than the wait timeout on a CI runner. Rather
         than fail the whole run on a transient slow render, retry a few times.
+        
+        Sites whose config has an ``api`` block are fetched straight from
+        their JSON product endpoint without starting a browser at all. With
+        ``cache_ttl`` set, a result is reused for that many seconds. An API
+        that answers a revalidation with 304 reuses the previous products.
+        
+        Args:
+            pool: Shared browser pool to scrape in; a private browser is
+                launched and closed around this scrape when omitted
         """
+        if self.cache_ttl > 0:
+            cached = _scrape_cache.get(self._cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                logger.info("Using cached scrape of %s", self.url)
+                return list(cached[1])
+        
+        products = await self._scrape_with_retries(pool)
+        
+        if self.cache_ttl > 0:
+            _scrape_cache[self._cache_key] = (time.monotonic() + self.cache_ttl, list(products))
+        return products
+    
+    @classmethod
+    def invalidate(cls):
+        """Drop all cached scrape results."""
+        _scrape_cache.clear()
+        _etag_cache.clear()
+    
+    async def _scrape_with_retries(self, pool: Optional[BrowserPool]) -> List[Product]:
+        """Scrape the site, retrying failed attempts."""
+        if pool is None and self.api is None:
+            pool = BrowserPool(self.headless)
+            try:
+                return await self._scrape_with_retries(pool)
+            finally:
+                await pool.close()
+        
         attempts = self.site_config.get('retries', 3)
         last_err = None
         for attempt in range(1, attempts + 1):
             try:
-                return self._scrape_once()
-            except Exception as e:  # PlaywrightTimeoutError and friends
+                if self.api is not None:
+                    return await self._scrape_api()
+                return await self._scrape_once(pool)
+            except Exception as e:  # PlaywrightTimeoutError, httpx errors and friends
                 last_err = e
-                logger.warning(f"Scrape attempt {attempt}/{attempts} failed: {e}")
-        logger.error(f"All {attempts} scrape attempts failed: {last_err}")
+                logger.warning("Scrape attempt %s/%s failed: %s", attempt, attempts, e)
+        logger.error("All %s scrape attempts failed: %s", attempts, last_err)
         raise last_err
 
-    def _scrape_once(self) -> List[Product]:
+    async def _scrape_api(self) -> List[Product]:
+        """A single scrape attempt against the site's JSON product API."""
+        api = self.api
+        logger.info("Fetching products from %s", api['url'])
+        
+        # Revalidate against the last response so an unchanged list costs a 304
+        headers = dict(api.get('headers') or {})
+        previous = _etag_cache.get(self._api_key)
+        if previous is not None:
+            headers['If-None-Match'] = previous[0]
+        
+        async with httpx.AsyncClient(timeout=self.wait_timeout / 1000) as client:
+            response = await client.request(
+                api.get('method', 'GET'),
+                api['url'],
+                headers=headers,
+                json=api.get('body')
+            )
+            if response.status_code == 304 and previous is not None:
+                logger.info("Products not modified, reusing %s products", len(previous[1]))
+                return list(previous[1])
+            response.raise_for_status()
+        
+        records = _json_path(orjson.loads(response.content), api.get('json_path', '')) or []
+        products = self._products_from_records(records, api['fields'])
+        etag = response.headers.get('etag')
+        if etag and products:
+            _etag_cache[self._api_key] = (etag, list(products))
+        logger.info("Successfully fetched %s products", len(products))
+        return products
+    
+    def _products_from_records(self, records: List[Dict[str, Any]],
+                               fields: Dict[str, str]) -> List[Product]:
+        """Build Products from JSON records using a field mapping.
+        
+        Args:
+            records: Product records from a JSON response
+            fields: Maps Product field names to dotted paths in each record
+            
+        Returns:
+            List of Product objects
+        """
+        products = []
+        for record in records:
+            try:
+                product = self._build_product_from_record(record, fields)
+                if product:
+                    products.append(product)
+            except Exception as e:
+                logger.warning("Error extracting product: %s", e)
+                continue
+        return products
+    
+    def _build_product_from_record(self, record: Dict[str, Any],
+                                   fields: Dict[str, str]) -> Optional[Product]:
+        """Build a Product from one JSON record.
+        
+        Args:
+            record: Product record from a JSON response
+            fields: Maps Product field names to dotted paths in the record
+            
+        Returns:
+            Product object or None if required fields are missing
+        """
+        def get(name: str) -> Any:
+            path = fields.get(name)
+            return _json_path(record, path) if path else None
+        
+        title = get('title')
+        price = self._coerce_price(get('price'))
+        if title is None or price is None:
+            return None
+        
+        url = get('url') or ''
+        if url and not url.startswith('http'):
+            url = self._base_url + url
+        
+        sku = get('sku')
+        sku = str(sku) if sku is not None else (url.split('/')[-1] if url else 'unknown')
+        
+        return Product(
+            sku=sku,
+            title=str(title).strip(),
+            price_cents=Product.to_cents(price),
+            original_price_cents=Product.to_cents(self._coerce_price(get('original_price'))),
+            url=url,
+            image=get('image') or '',
+            discount=get('discount')
+        )
+    
+    @classmethod
+    def _coerce_price(cls, value: Any) -> Optional[float]:
+        """Read a JSON price that may be a number or a display string."""
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        if isinstance(value, str):
+            return cls._try_parse_price(value)
+        return None
+    
+    async def _scrape_once(self, pool: BrowserPool) -> List[Product]:
         """A single scrape attempt."""
-        logger.info(f"Starting scrape of {self.url}")
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
+        logger.info("Starting scrape of %s", self.url)
+        async with pool.page(self.storage_state) as page:
+            await page.route("**/*", _block_unneeded_requests)
+
+            # Capture the XHR the page renders its product list from, if the
+            # site config says which one it is
+            captured: List[Response] = []
+            if self.capture is not None:
+                url_part = self.capture['url_contains']
+                method = self.capture.get('method', 'POST')
+                page.on("response", lambda r: captured.append(r)
+                        if url_part in r.url and r.request.method == method else None)
+
+            # Only wait for the response to commit; the explicit selector waits
+            # below decide when the page is ready, not unrelated subresources
+            logger.info("Navigating to page...")
+            await page.goto(self.url, wait_until='commit', timeout=60000)
+
+            # Wait for products to load
+            logger.info("Waiting for products selector: %s", self.wait_for_selector)
+            await page.wait_for_selector(self.wait_for_selector, timeout=self.wait_timeout)
+
+            # Prefer the captured JSON over scraping the DOM it was rendered to
+            if captured:
+                products = await self._products_from_response(captured[-1])
+                if products:
+                    logger.info("Successfully read %s products from captured response", len(products))
+                    return products
+
+            # Wait until the product count stops changing rather than sleeping
+            # a fixed amount for the JS rendering to finish. An empty listing
+            # settles after about 3 s; if the count keeps changing until the
+            # timeout, extract whatever is there instead of failing the scrape.
             try:
-                context = browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+                await page.wait_for_function(
+                    _STABLE_COUNT_JS,
+                    arg={'sel': self.selectors['product_container'], 'empty_polls': _EMPTY_SETTLE_POLLS},
+                    polling=250,
+                    timeout=self.wait_timeout
                 )
-                page = context.new_page()
-
-                logger.info("Navigating to page...")
-                page.goto(self.url, wait_until='domcontentloaded', timeout=60000)
-
-                # Handle cookie popup if present
-                try:
-                    cookie_button = page.locator('button:has-text("Allow Cookies")').first
-                    if cookie_button.is_visible(timeout=5000):
-                        logger.info("Clicking cookie accept button...")
-                        cookie_button.click()
-                        page.wait_for_timeout(1000)
-                except Exception as e:
-                    logger.info(f"No cookie popup or already dismissed: {e}")
-
-                # Wait for products to load
-                logger.info(f"Waiting for products selector: {self.wait_for_selector}")
-                page.wait_for_selector(self.wait_for_selector, timeout=self.wait_timeout)
-                page.wait_for_timeout(3000)  # additional wait for JS rendering
-
-                products = self._extract_products(page)
-                logger.info(f"Successfully scraped {len(products)} products")
-                return products
-            finally:
-                browser.close()
+            except PlaywrightTimeoutError:
+                logger.warning("Product count did not settle, extracting what is on the page")
+
+            # Handle cookie popup if present. The products have rendered by
+            # now, so a short timeout is enough; once accepted, the saved
+            # storage state keeps it from appearing again.
+            try:
+                cookie_button = page.locator('button:has-text("Allow Cookies")').first
+                await cookie_button.click(timeout=500, no_wait_after=True)
+                logger.info("Accepted cookie popup")
+                if self.storage_state:
+                    await page.context.storage_state(path=str(self.storage_state))
+            except Exception as e:
+                logger.debug("No cookie popup or already dismissed: %s", e)
+
+            products = await self._extract_products(page)
+            logger.info("Successfully scraped %s products", len(products))
+            return products
+    
+    async def _products_from_response(self, response: Response) -> List[Product]:
+        """Build Products from a captured product-list response.
+        
+        Args:
+            response: Playwright response for the site's product XHR
+            
+        Returns:
+            List of Product objects; empty if the body couldn't be used, so
+            the caller falls back to DOM extraction
+        """
+        try:
+            data = orjson.loads(await response.body())
+        except Exception as e:
+            logger.warning("Could not read captured response, falling back to DOM: %s", e)
+            return []
+        records = _json_path(data, self.capture.get('json_path', '')) or []
+        return self._products_from_records(records, self.capture['fields'])
     
-    def _extract_products(self, page: Page) -> List[Product]:
+    async def _extract_products(self, page: Page) -> List[Product]:
         """Extract product data from the page.
         
+        All DOM reads happen in one evaluate_all call that returns the raw
+        field strings for every product container, instead of several CDP
+        round-trips per product; parsing then happens here in Python. The
+        fields arrive as a single JSON string decoded with orjson.
+        
         Args:
             page: Playwright page object
             
         Returns:
             List of Product objects
         """
-        products = []
-        
-        # Find all product containers
-        product_elements = page.query_selector_all(self.selectors['product_container'])
+        containers = page.locator(self.selectors['product_container'])
+        raw_products = orjson.loads(await containers.evaluate_all(_EXTRACT_PRODUCTS_JS, self._extract_args))
         
-        logger.info(f"Found {len(product_elements)} product elements")
+        logger.info("Found %s product elements", len(raw_products))
         
-        for element in product_elements:
+        products = []
+        for raw in raw_products:
             try:
-                product = self._extract_product(element)
+                product = self._build_product(raw)
                 if product:
                     products.append(product)
             except Exception as e:
-                logger.warning(f"Error extracting product: {e}")
+                logger.warning("Error extracting product: %s", e)
                 continue
         
         return products
     
-    def _extract_product(self, element) -> Optional[Product]:
-        """Extract product data from a single product element.
+    def _build_product(self, raw: Dict[str, Any]) -> Optional[Product]:
+        """Build a Product from the raw fields extracted in the browser.
         
         Args:
-            element: Playwright element locator
+            raw: Field strings for one product container
             
         Returns:
-            Product object or None if extraction fails
+            Product object or None if required fields are missing
         """
-        try:
-            # Extract URL first (it's on the parent a.result element)
-            url_element = element.query_selector(self.selectors['url'])
-            if not url_element:
-                return None
-            url = url_element.get_attribute('href')
-            if url and not url.startswith('http'):
-                base_url = self.url.split('/digiseconds')[0]
-                url = base_url + url
-            
-            # Extract SKU from URL or data attribute
-            data_objectid = url_element.get_attribute('data-objectid')
-            if data_objectid:
-                sku = data_objectid
-            else:
-                # Try to extract from URL
-                sku = url.split('/')[-1] if url else 'unknown'
-            
-            # Extract title
-            title_element = element.query_selector(self.selectors['title'])
-            if not title_element:
-                return None
-            title = title_element.inner_text().strip()
-            
-            # Extract price - try multiple selectors and fallbacks
-            price = None
-            price_selectors = [
-                self.selectors['price'],
-                'span.after_special.custom_final_price',
-                'span.custom_final_price.black-friday',
-                'span.custom_final_price',
-                'span.after_special',
-                'meta[itemprop="price"]'
-            ]
-            
-            for selector in price_selectors:
-                price_element = element.query_selector(selector)
-                if price_element:
-                    if selector.startswith('meta'):
-                        price_text = price_element.get_attribute('content')
-                    else:
-                        price_text = price_element.inner_text().strip()
-                    
-                    if price_text:
-                        try:
-                            price = self._parse_price(price_text)
-                            break
-                        except Exception as e:
-                            logger.debug(f"Failed to parse price '{price_text}' with selector '{selector}': {e}")
-                            continue
-            
-            if price is None:
-                logger.warning(f"Could not extract price for {title}")
-                return None
-            
-            # Extract original price (optional)
-            original_price = None
-            original_price_element = element.query_selector(self.selectors['original_price'])
-            if original_price_element:
-                try:
-                    original_price_text = original_price_element.inner_text().strip()
-                    original_price = self._parse_price(original_price_text)
-                except:
-                    pass
-            
-            # Extract image
-            image_element = element.query_selector(self.selectors['image'])
-            image = image_element.get_attribute('src') if image_element else ''
-            
-            # Extract discount (optional)
-            discount = None
-            discount_selector = self.selectors.get('discount', '')
-            if discount_selector:
-                discount_element = element.query_selector(discount_selector)
-                if discount_element:
-                    discount = discount_element.inner_text().strip()
-            
-            return Product(
-                sku=sku,
-                title=title,
-                price=price,
-                original_price=original_price,
-                url=url,
-                image=image,
-                discount=discount
-            )
-            
-        except Exception as e:
-            logger.warning(f"Error extracting product details: {e}")
+        # The link (on the parent a.result element) is required; its URL is
+        # already absolute and the SKU already derived in the browser
+        if not raw['has_url']:
             return None
+        
+        title = raw['title']
+        if title is None:
+            return None
+        
+        # Price - the first candidate selector whose text parses wins
+        price = None
+        for price_text in raw['prices']:
+            if price_text and (parsed := self._try_parse_price(price_text)) is not None:
+                price = parsed
+                break
+        
+        if price is None:
+            logger.warning("Could not extract price for %s", title)
+            return None
+        
+        # Original price (optional)
+        original_price = None
+        if raw['original_price']:
+            original_price = self._try_parse_price(raw['original_price'])
+        
+        return Product(
+            sku=raw['sku'],
+            title=title,
+            price_cents=Product.to_cents(price),
+            original_price_cents=Product.to_cents(original_price),
+            url=raw['url'],
+            image=raw['image'] or '',
+            discount=raw['discount']
+        )
     
     @staticmethod
-    def _parse_price(price_text: str) -> float:
+    def _try_parse_price(price_text: str) -> Optional[float]:
         """Parse price string to float.
         
         Args:
-            price_text: Price string like "$6,554.05"
+            price_text: Price string like "$6,554.05" or "$.99"
             
         Returns:
-            Float price value
+            Float price value, or None if the string isn't a price
         """
-        # Remove currency symbols and commas
-        clean_price = price_text.replace('$', '').replace(',', '').strip()
-        return float(clean_price)
-
+        match = _PRICE_RE.fullmatch(price_text)
+        if match is None:
+            return None
+        return float(match.group(1).replace(',', ''))
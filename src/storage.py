@@ -1,10 +1,14 @@
 """Storage module for persisting product state in JSON format."""
-import json
+import hashlib
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +23,8 @@ class Storage:
         """
         self.state_file = state_file
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        # Last state read or written; this process is the file's only writer
+        self._state_cache: Optional[Dict[str, Any]] = None
     
     def load_state(self) -> Optional[Dict[str, Any]]:
         """Load previous state from JSON file.
@@ -26,17 +32,20 @@ class Storage:
         Returns:
             Dictionary containing previous state or None if no state exists
         """
+        if self._state_cache is not None:
+            return self._state_cache
+        
         if not self.state_file.exists():
             logger.info("No previous state found")
             return None
         
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
-            logger.info(f"Loaded state with {len(state.get('products', []))} products")
+            state = orjson.loads(self.state_file.read_bytes())
+            logger.info("Loaded state with %s products", len(state.get('products', [])))
+            self._state_cache = state
             return state
         except Exception as e:
-            logger.error(f"Error loading state: {e}")
+            logger.error("Error loading state: %s", e)
             return None
     
     def save_state(self, products: List[Dict[str, Any]]) -> bool:
@@ -55,14 +64,35 @@ class Storage:
         }
         
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
-            logger.info(f"Saved state with {len(products)} products")
+            # Write to a temp file and rename over the old state so a crash
+            # mid-write can never leave a truncated state file behind
+            tmp_file = self.state_file.with_suffix('.tmp')
+            tmp_file.write_bytes(
+                orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            )
+            os.replace(tmp_file, self.state_file)
+            self._state_cache = state
+            logger.info("Saved state with %s products", len(products))
             return True
         except Exception as e:
-            logger.error(f"Error saving state: {e}")
+            logger.error("Error saving state: %s", e)
             return False
     
+    @staticmethod
+    def fingerprint(products: List[Dict[str, Any]]) -> str:
+        """Compute a stable hash over the SKUs and prices of a product list.
+        
+        Args:
+            products: List of product dictionaries
+            
+        Returns:
+            Hex digest that is equal for lists with the same SKUs and prices
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for sku, price_cents in sorted((p['sku'], p.get('price_cents')) for p in products):
+            h.update(f"{sku}|{price_cents}\n".encode())
+        return h.hexdigest()
+    
     def get_products_from_state(self, state: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Extract products list from state.
         
@@ -83,11 +113,17 @@ class Storage:
             True if successful
         """
         try:
+            self._state_cache = None
             if self.state_file.exists():
                 self.state_file.unlink()
                 logger.info("State file cleared")
             return True
         except Exception as e:
-            logger.error(f"Error clearing state: {e}")
+            logger.error("Error clearing state: %s", e)
             return False
 
+
+@lru_cache(maxsize=None)
+def get_storage(state_file: Path) -> Storage:
+    """Return the shared Storage for a state file path."""
+    return Storage(state_file)